@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Build script for the AOT-compiled analysis kernels.
+
+Run `python build_aot.py` to produce the `finvesta_kernels` extension
+module next to the sources. crypto_monitor prefers the AOT module when it
+is importable, so CLI runs skip the JIT warm-up entirely; without it the
+code falls back to njit (or plain Python when Numba is absent).
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("finvesta_kernels")
+cc.verbose = True
+
+
+@cc.export("health_metrics", "UniTuple(f8, 7)(f8[::1], f8[::1])")
+def health_metrics(prices, volumes):
+    """Same arithmetic as crypto_monitor._health_metrics."""
+    current_price = prices[-1]
+    avg_price = prices.mean()
+    price_change = (current_price - prices[0]) / prices[0] * 100.0
+
+    n = prices.size
+    if n > 1:
+        squared_diff = 0.0
+        for i in range(n):
+            squared_diff += (prices[i] - avg_price) ** 2
+        price_volatility = (squared_diff / (n - 1)) ** 0.5 / avg_price * 100.0
+    else:
+        price_volatility = np.nan
+
+    current_volume = volumes[-1]
+    avg_volume = volumes.mean()
+    volume_change = (current_volume - volumes[0]) / volumes[0] * 100.0
+
+    return (current_price, avg_price, price_change, price_volatility,
+            current_volume, avg_volume, volume_change)
+
+
+@cc.export("sustainability", "f8(f8, f8, f8, f8)")
+def sustainability(daily_volume, tax_rate, total_supply_value, daily_roi):
+    """Sustainability ratio: daily tax revenue over required payouts."""
+    required_payouts = total_supply_value * daily_roi
+    if required_payouts <= 0:
+        return np.inf
+    return daily_volume * tax_rate / required_payouts
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -5,27 +5,363 @@ This program monitors the health of crypto tax economies including Finvesta and
 It tracks wallet activities, price movements, trading volumes, and performs sustainability checks.
 """
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import matplotlib
+matplotlib.use("Agg")  # headless backend; skips GUI toolkit init
 import matplotlib.pyplot as plt
 from datetime import datetime
 import os
 from dotenv import load_dotenv
 import time
 import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    # AOT-compiled kernels built by build_aot.py; importing them avoids
+    # paying JIT compilation on every cold CLI start
+    import finvesta_kernels
+except ImportError:
+    finvesta_kernels = None
 
 # Load environment variables
 load_dotenv()
 
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket limiting sustained request rate.
+
+    Shared by all monitor instances so the combined CoinGecko traffic of
+    the thread pool never exceeds the free-tier budget, whatever the pool
+    size is.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate  # tokens replenished per second
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.rate
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def refund(self):
+        """Return a token (e.g. when a request was served from cache)."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+
+# CoinGecko throttles free-tier callers to roughly 2 requests per second
+_COINGECKO_BUCKET = _TokenBucket(rate=2)
+
+
+def _health_metrics(prices, volumes):
+    """
+    Numeric kernel behind analyze_token_health.
+
+    Takes contiguous float64 arrays and returns (current_price, avg_price,
+    price_change, price_volatility, current_volume, avg_volume,
+    volume_change). Kept as a free function of plain arrays so Numba can
+    compile it to native code; the interpreted version runs when Numba is
+    not installed.
+    """
+    current_price = prices[-1]
+    avg_price = prices.mean()
+    price_change = (current_price - prices[0]) / prices[0] * 100.0
+
+    # Sample standard deviation (ddof=1), written out so the same source
+    # compiles under njit
+    n = prices.size
+    if n > 1:
+        squared_diff = 0.0
+        for i in range(n):
+            squared_diff += (prices[i] - avg_price) ** 2
+        price_volatility = (squared_diff / (n - 1)) ** 0.5 / avg_price * 100.0
+    else:
+        price_volatility = np.nan
+
+    current_volume = volumes[-1]
+    avg_volume = volumes.mean()
+    volume_change = (current_volume - volumes[0]) / volumes[0] * 100.0
+
+    return (current_price, avg_price, price_change, price_volatility,
+            current_volume, avg_volume, volume_change)
+
+
+if finvesta_kernels is not None:
+    _health_metrics = finvesta_kernels.health_metrics
+elif njit is not None:
+    _health_metrics = njit(cache=True, fastmath=True)(_health_metrics)
+
+
+def _plot_one(token_id, dates, prices, volumes, save_path):
+    """
+    Render one token's price/volume figure to disk.
+
+    Module-level so worker processes can pickle it, and takes plain numpy
+    arrays rather than a DataFrame to keep the IPC payload small.
+
+    Args:
+        token_id: Token identifier (used for titles)
+        dates: Array of datetimes for the x axis
+        prices: Array of prices
+        volumes: Array of volumes
+        save_path: Path to save the plot image
+
+    Returns:
+        The save path
+    """
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+
+    ax1.plot(dates, prices, 'b-')
+    ax1.set_title(f"{token_id.upper()} Price (USD)")
+    ax1.set_ylabel("Price (USD)")
+    ax1.grid(True)
+
+    ax2.bar(dates, volumes, color='g', alpha=0.6)
+    ax2.set_title(f"{token_id.upper()} Trading Volume (USD)")
+    ax2.set_xlabel("Date")
+    ax2.set_ylabel("Volume (USD)")
+    ax2.grid(True)
+
+    fig.tight_layout()
+    fig.savefig(save_path)
+    plt.close(fig)
+    return save_path
+
+
+def dump_json_bytes(report):
+    """
+    Serialize a report to indented JSON bytes.
+
+    Uses orjson (a C serializer that also handles numpy scalars) when
+    available, falling back to the stdlib encoder. Callers that both print
+    and save a report should serialize once and reuse the bytes.
+
+    Args:
+        report: Report data to serialize
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(report, indent=2, default=str).encode()
+
+
+def write_json_report(report, output_file, payload=None):
+    """
+    Serialize a report to indented JSON and write it atomically.
+
+    The payload is written to a temp file and os.replace'd into place so a
+    crash mid-write never leaves a truncated report behind.
+
+    Args:
+        report: Report data to serialize
+        output_file: Destination path for the JSON file
+        payload: Pre-serialized bytes from dump_json_bytes, to skip a
+            second encode pass (optional)
+    """
+    if payload is None:
+        payload = dump_json_bytes(report)
+
+    tmp_path = f"{output_file}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, output_file)
+
+
+def append_ndjson_report(entries, output_file):
+    """
+    Append report entries to a rolling NDJSON log, one JSON object per line.
+
+    Unlike the monolithic report file, this never re-serializes history:
+    each check appends only its own records, and consumers can tail the
+    log instead of reparsing the whole file.
+
+    Args:
+        entries: Iterable of JSON-serializable report entries
+        output_file: Path of the NDJSON log to append to
+    """
+    with open(output_file, "ab") as f:
+        f.write(_ndjson_payload(entries))
+
+
+def _ndjson_payload(entries):
+    """Serialize report entries to newline-delimited JSON bytes."""
+    if orjson is not None:
+        return b"".join(
+            orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+            for entry in entries
+        )
+    return "".join(
+        json.dumps(entry, default=str) + "\n" for entry in entries
+    ).encode()
+
+
+def flush_payloads(payloads):
+    """
+    Write several output files in one batch.
+
+    When aiofiles is available the writes are overlapped on a single
+    event loop instead of blocking one after another; otherwise they fall
+    back to sequential writes. "wb" payloads go through the same
+    temp-file-plus-os.replace dance as write_json_report, "ab" payloads
+    are appended in place.
+
+    Args:
+        payloads: Iterable of (path, data, mode) tuples, where mode is
+            "wb" for an atomic overwrite or "ab" for an append
+    """
+    payloads = list(payloads)
+
+    if aiofiles is None or len(payloads) < 2:
+        for path, data, mode in payloads:
+            _write_payload(path, data, mode)
+        return
+
+    async def _flush():
+        async def _write_one(path, data, mode):
+            if mode == "ab":
+                async with aiofiles.open(path, "ab") as f:
+                    await f.write(data)
+                return
+            tmp_path = f"{path}.tmp"
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            os.replace(tmp_path, path)
+
+        await asyncio.gather(*(
+            _write_one(path, data, mode) for path, data, mode in payloads
+        ))
+
+    asyncio.run(_flush())
+
+
+def _write_payload(path, data, mode):
+    """Blocking single-file counterpart of flush_payloads."""
+    if mode == "ab":
+        with open(path, "ab") as f:
+            f.write(data)
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
 class CryptoMonitor:
     def __init__(self):
         """Initialize the CryptoMonitor with default settings."""
         self.tokens = ["hex", "pls"]  # Default tokens to monitor
         self.wallets = {}  # Dictionary to store wallet addresses
-        self.data_cache = {}  # Cache for API responses
         self.coingecko_base_url = "https://api.coingecko.com/api/v3"
         self.pulsechain_base_url = "https://scan.pulsechain.com/api"
-        
+
+        # Shared session (keep-alive) and thread pool for concurrent fetches.
+        # When requests-cache is installed, responses persist on disk across
+        # runs: a few minutes for spot prices, a day for 30-day history, so
+        # back-to-back health checks do no network I/O at all.
+        if requests_cache is not None:
+            self._session = requests_cache.CachedSession(
+                "cg_cache",
+                backend="sqlite",
+                expire_after=300,
+                urls_expire_after={"*/market_chart*": 86400, "*/coins/list*": 86400}
+            )
+        else:
+            self._session = requests.Session()
+
+        # Pooled connections sized for the thread pool, with automatic
+        # retries (incl. backoff) on rate limiting and transient 5xx errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                # 429s are handled by the token-bucket limiter so the
+                # adapter only retries transient server errors
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._known_ids = None  # Lazily fetched set of valid CoinGecko IDs
+
+    def _coingecko_get(self, url, params=None):
+        """
+        Issue a rate-limited GET against CoinGecko.
+
+        Takes a token from the shared bucket before each attempt (refunding
+        it when the response came from the local cache) and honours the
+        Retry-After header on 429 responses before retrying.
+
+        Args:
+            url: Full CoinGecko URL
+            params: Query parameters (optional)
+
+        Returns:
+            The requests Response object
+        """
+        response = None
+        for _ in range(3):
+            _COINGECKO_BUCKET.acquire()
+            response = self._session.get(url, params=params, timeout=10)
+            if getattr(response, "from_cache", False):
+                _COINGECKO_BUCKET.refund()
+            if response.status_code != 429:
+                return response
+            retry_after = int(response.headers.get("Retry-After", 2))
+            print(f"Rate limited by CoinGecko, retrying in {retry_after}s...")
+            time.sleep(retry_after)
+        return response
+
     def add_token(self, token_id, token_name=None):
         """Add a token to the monitoring list."""
         if token_id not in self.tokens:
@@ -37,6 +373,38 @@ class CryptoMonitor:
         self.wallets[name] = address
         print(f"Added wallet '{name}' with address {address} to monitoring list.")
     
+    def _is_known_token(self, token_id):
+        """
+        Check whether CoinGecko knows a token ID, without a per-token call.
+
+        The full /coins/list index is fetched once per process (and cached
+        on disk for a day by requests-cache), so requests for tokens the
+        exchange has never heard of are short-circuited locally instead of
+        burning rate-limit budget on guaranteed 404s.
+
+        Args:
+            token_id: CoinGecko token ID to validate
+
+        Returns:
+            True if the ID is listed (or the index is unavailable)
+        """
+        if self._known_ids is None:
+            try:
+                response = self._coingecko_get(f"{self.coingecko_base_url}/coins/list")
+                if response.status_code == 200:
+                    self._known_ids = {coin["id"] for coin in response.json()}
+                else:
+                    print(f"Could not fetch CoinGecko coin list: {response.status_code}")
+                    self._known_ids = ()
+            except Exception as e:
+                print(f"Exception when fetching CoinGecko coin list: {str(e)}")
+                self._known_ids = ()
+
+        # If the index couldn't be fetched, don't filter anything
+        if not self._known_ids:
+            return True
+        return token_id in self._known_ids
+
     def get_token_data(self, token_id, days=30, vs_currency="usd"):
         """
         Fetch price and volume data for a token from CoinGecko.
@@ -49,28 +417,30 @@ class CryptoMonitor:
         Returns:
             DataFrame with timestamp, price, and volume data
         """
-        cache_key = f"{token_id}_{days}_{vs_currency}"
-        if cache_key in self.data_cache:
-            return self.data_cache[cache_key]
-            
-        url = f"{self.coingecko_base_url}/coins/{token_id}/market_chart?vs_currency={vs_currency}&days={days}"
-        
+        if not self._is_known_token(token_id):
+            print(f"Skipping {token_id}: not listed on CoinGecko")
+            return None
+
+        url = f"{self.coingecko_base_url}/coins/{token_id}/market_chart"
+
         try:
-            response = requests.get(url)
+            response = self._coingecko_get(
+                url,
+                params={"vs_currency": vs_currency, "days": days}
+            )
             if response.status_code == 200:
                 data = response.json()
-                prices = pd.DataFrame(data["prices"], columns=["timestamp", "price"])
-                volumes = pd.DataFrame(data["total_volumes"], columns=["timestamp", "volume"])
-                
+                # "prices" and "total_volumes" are parallel arrays sharing the
+                # same timestamps, so build one frame directly instead of two
+                # frames plus a merge (which hash-joins and copies every row)
+                result = pd.DataFrame({
+                    "timestamp": [p[0] for p in data["prices"]],
+                    "price": [p[1] for p in data["prices"]],
+                    "volume": [v[1] for v in data["total_volumes"]]
+                })
+
                 # Convert timestamp from milliseconds to datetime
-                prices["date"] = pd.to_datetime(prices["timestamp"], unit="ms")
-                volumes["date"] = pd.to_datetime(volumes["timestamp"], unit="ms")
-                
-                # Merge price and volume data
-                result = prices.merge(volumes, on=["timestamp", "date"])
-                
-                # Cache the result
-                self.data_cache[cache_key] = result
+                result["date"] = pd.to_datetime(result["timestamp"], unit="ms", cache=True)
                 return result
             else:
                 print(f"Error fetching data for {token_id}: {response.status_code}")
@@ -79,29 +449,73 @@ class CryptoMonitor:
             print(f"Exception when fetching data for {token_id}: {str(e)}")
             return None
     
-    def get_pulsechain_wallet(self, wallet_address):
+    def get_tokens_snapshot(self, token_ids, vs_currency="usd"):
         """
-        Fetch transaction data for a wallet on PulseChain.
-        
+        Fetch current price and 24h volume/change for several tokens in one call.
+
+        Uses CoinGecko's multi-ID /simple/price endpoint so a health pass over
+        N tokens costs one round-trip instead of N.
+
+        Args:
+            token_ids: List of CoinGecko token IDs
+            vs_currency: Currency to compare against (default: USD)
+
+        Returns:
+            Dictionary keyed by token ID with price, 24h volume and 24h change
+        """
+        token_ids = [token_id for token_id in token_ids if self._is_known_token(token_id)]
+        if not token_ids:
+            return {}
+
+        url = f"{self.coingecko_base_url}/simple/price"
+        params = {
+            "ids": ",".join(token_ids),
+            "vs_currencies": vs_currency,
+            "include_24hr_vol": "true",
+            "include_24hr_change": "true"
+        }
+
+        try:
+            response = self._coingecko_get(url, params=params)
+            if response.status_code == 200:
+                data = response.json()
+                snapshot = {}
+                for token_id in token_ids:
+                    if token_id in data:
+                        token_data = data[token_id]
+                        snapshot[token_id] = {
+                            "price": token_data.get(vs_currency),
+                            "volume_24h": token_data.get(f"{vs_currency}_24h_vol"),
+                            "change_24h": token_data.get(f"{vs_currency}_24h_change")
+                        }
+                return snapshot
+            else:
+                print(f"Error fetching snapshot for {len(token_ids)} tokens: {response.status_code}")
+                return {}
+        except Exception as e:
+            print(f"Exception when fetching token snapshot: {str(e)}")
+            return {}
+
+    def get_pulsechain_transactions(self, wallet_address):
+        """
+        Fetch raw transaction records for a wallet on PulseChain.
+
         Args:
             wallet_address: The wallet address to check
-            
+
         Returns:
-            DataFrame with transaction data
+            List of transaction dicts (newest first), or None on error
         """
-        url = f"{self.pulsechain_base_url}?module=account&action=txlist&address={wallet_address}"
-        
         try:
-            response = requests.get(url)
+            response = self._session.get(
+                self.pulsechain_base_url,
+                params={"module": "account", "action": "txlist", "address": wallet_address},
+                timeout=10
+            )
             if response.status_code == 200:
                 data = response.json()
                 if data["status"] == "1":
-                    transactions = pd.DataFrame(data["result"])
-                    # Convert timestamp to datetime
-                    transactions["datetime"] = pd.to_datetime(transactions["timeStamp"], unit="s")
-                    # Convert value from wei to ETH/PLS
-                    transactions["value_eth"] = transactions["value"].astype(float) / 1e18
-                    return transactions[["hash", "value", "value_eth", "from", "to", "timeStamp", "datetime"]]
+                    return data["result"]
                 else:
                     print(f"Error fetching wallet data: {data.get('message', 'Unknown error')}")
                     return None
@@ -111,6 +525,45 @@ class CryptoMonitor:
         except Exception as e:
             print(f"Exception when fetching wallet data: {str(e)}")
             return None
+
+    def get_pulsechain_wallet(self, wallet_address):
+        """
+        Fetch transaction data for a wallet on PulseChain.
+
+        Args:
+            wallet_address: The wallet address to check
+
+        Returns:
+            DataFrame with transaction data
+        """
+        rows = self.get_pulsechain_transactions(wallet_address)
+        if rows is None:
+            return None
+
+        # Project to the needed columns at parse time instead of framing
+        # the full explorer payload (dozens of unused object-dtype
+        # columns), and parse the numeric fields straight into typed arrays
+        values = np.fromiter((float(r["value"]) for r in rows),
+                             dtype=np.float64, count=len(rows))
+        timestamps = np.fromiter((int(r["timeStamp"]) for r in rows),
+                                 dtype=np.int64, count=len(rows))
+        transactions = pd.DataFrame({
+            "hash": [r["hash"] for r in rows],
+            "value": [r["value"] for r in rows],
+            # Convert value from wei to ETH/PLS
+            "value_eth": values / 1e18,
+            # Addresses are ASCII hex: normalize the case once here and
+            # store as category so later comparisons are integer code
+            # equality, not string passes
+            "from": pd.Categorical([r["from"].lower() for r in rows]),
+            "to": pd.Categorical([r["to"].lower() for r in rows]),
+            "timeStamp": timestamps
+        })
+        # Convert timestamp to datetime; the column is already int64 so the
+        # conversion hits the fast numeric path, and cache=True dedupes
+        # repeated timestamps (bursts of txs in the same block)
+        transactions["datetime"] = pd.to_datetime(transactions["timeStamp"], unit="s", cache=True)
+        return transactions
     
     def check_wallet_activity(self, wallet_name=None, wallet_address=None, threshold=0.05):
         """
@@ -131,80 +584,114 @@ class CryptoMonitor:
             print("No wallet address provided.")
             return None
             
-        transactions = self.get_pulsechain_wallet(wallet_address)
-        if transactions is None or len(transactions) == 0:
+        rows = self.get_pulsechain_transactions(wallet_address)
+        if not rows:
             print(f"No transactions found for wallet {wallet_name or wallet_address}")
             return None
-            
-        # Get the latest transaction
-        latest_tx = transactions.iloc[0]  # Assuming transactions are sorted by timestamp (newest first)
-        
-        # Calculate statistics
-        total_txs = len(transactions)
-        incoming_txs = transactions[transactions["to"].str.lower() == wallet_address.lower()]
-        outgoing_txs = transactions[transactions["from"].str.lower() == wallet_address.lower()]
-        
-        # Check for large transactions
-        large_txs = transactions[abs(transactions["value_eth"]) > threshold]
-        
+
+        # The summary only needs counters, the latest row and the large
+        # transactions, so compute everything in one pass over the raw
+        # records instead of materializing a DataFrame and filtering it
+        addr = wallet_address.lower()
+        total_txs = len(rows)
+        incoming_count = 0
+        outgoing_count = 0
+        large_txs = []  # (value_eth, is_outgoing, timestamp)
+
+        for row in rows:
+            value_eth = float(row["value"]) / 1e18
+            is_outgoing = row["from"].lower() == addr
+            if row["to"].lower() == addr:
+                incoming_count += 1
+            if is_outgoing:
+                outgoing_count += 1
+            if abs(value_eth) > threshold:
+                large_txs.append((value_eth, is_outgoing, int(row["timeStamp"])))
+
+        # Latest transaction (records are sorted newest first)
+        latest_tx = rows[0]
+
         # Prepare summary
         summary = {
             "wallet": wallet_name or wallet_address,
             "total_transactions": total_txs,
-            "incoming_transactions": len(incoming_txs),
-            "outgoing_transactions": len(outgoing_txs),
+            "incoming_transactions": incoming_count,
+            "outgoing_transactions": outgoing_count,
             "large_transactions": len(large_txs),
             "latest_transaction": {
                 "hash": latest_tx["hash"],
-                "value": latest_tx["value_eth"],
-                "from": latest_tx["from"],
-                "to": latest_tx["to"],
-                "timestamp": latest_tx["datetime"].strftime("%Y-%m-%d %H:%M:%S")
+                "value": float(latest_tx["value"]) / 1e18,
+                "from": latest_tx["from"].lower(),
+                "to": latest_tx["to"].lower(),
+                "timestamp": datetime.utcfromtimestamp(int(latest_tx["timeStamp"])).strftime("%Y-%m-%d %H:%M:%S")
             }
         }
-        
-        # Alert for large outflows
-        if len(large_txs) > 0:
-            print(f"🚨 Found {len(large_txs)} large transactions for {wallet_name or wallet_address}")
-            for _, tx in large_txs.iterrows():
-                direction = "outgoing" if tx["from"].lower() == wallet_address.lower() else "incoming"
-                print(f"  - {direction.upper()}: {abs(tx['value_eth'])} ETH/PLS on {tx['datetime'].strftime('%Y-%m-%d %H:%M:%S')}")
-        
+
+        # Alert for large outflows; one batched print
+        if large_txs:
+            lines = [
+                f"  - {'OUTGOING' if is_outgoing else 'INCOMING'}: {abs(value_eth)} ETH/PLS "
+                f"on {datetime.utcfromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')}"
+                for value_eth, is_outgoing, timestamp in large_txs
+            ]
+            print(f"🚨 Found {len(large_txs)} large transactions for {wallet_name or wallet_address}\n"
+                  + "\n".join(lines))
+
         return summary
     
-    def analyze_token_health(self, token_id):
+    def analyze_token_health(self, token_id, snapshot=None, include_history=True, data=None):
         """
         Analyze the health of a token based on price and volume trends.
-        
+
         Args:
             token_id: CoinGecko token ID
-            
+            snapshot: Optional snapshot from get_tokens_snapshot to reuse
+            include_history: Whether to fetch the 30-day series (needed for
+                volatility and 30-day change); when False the snapshot data
+                is used and no per-token market_chart call is made
+            data: Optional pre-fetched frame from get_token_data, so callers
+                that need the series for several checks fetch it only once
+
         Returns:
             Dictionary with token health metrics
         """
-        data = self.get_token_data(token_id)
+        # Fast path: current metrics only, served from the batched snapshot
+        if not include_history:
+            if snapshot is None:
+                snapshot = self.get_tokens_snapshot([token_id])
+            token_snapshot = snapshot.get(token_id)
+            if not token_snapshot or token_snapshot["price"] is None:
+                print(f"No snapshot data available for {token_id}")
+                return None
+
+            return {
+                "token": token_id,
+                "current_price": token_snapshot["price"],
+                "price_change_24h": token_snapshot["change_24h"],
+                "current_volume": token_snapshot["volume_24h"],
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+
+        if data is None:
+            data = self.get_token_data(token_id)
         if data is None or len(data) == 0:
             print(f"No data available for {token_id}")
             return None
-            
-        # Calculate metrics
-        current_price = data["price"].iloc[-1]
-        avg_price = data["price"].mean()
-        price_change = (current_price - data["price"].iloc[0]) / data["price"].iloc[0] * 100
-        
-        current_volume = data["volume"].iloc[-1]
-        avg_volume = data["volume"].mean()
-        volume_change = (current_volume - data["volume"].iloc[0]) / data["volume"].iloc[0] * 100
-        
+
+        # Calculate metrics on the raw numpy buffers; one array extraction
+        # per column, then the (optionally JIT-compiled) numeric kernel
+        prices = np.ascontiguousarray(data["price"].to_numpy(dtype=np.float64))
+        volumes = np.ascontiguousarray(data["volume"].to_numpy(dtype=np.float64))
+
+        (current_price, avg_price, price_change, price_volatility,
+         current_volume, avg_volume, volume_change) = _health_metrics(prices, volumes)
+
         # Volume health check
         volume_health = "Normal"
         if current_volume < avg_volume * 0.5:
             volume_health = "Warning: Volume drop"
         elif current_volume > avg_volume * 2:
             volume_health = "High volume activity"
-            
-        # Price volatility
-        price_volatility = data["price"].std() / avg_price * 100
         
         # Prepare health report
         health_report = {
@@ -239,36 +726,80 @@ class CryptoMonitor:
         if data is None or len(data) == 0:
             print(f"No data available for {token_id}")
             return None
-            
-        # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
-        
+
+        # Reuse one cached figure across calls; rebuilding a full figure and
+        # axes per token is the slow part of the report plotting loop
+        if not hasattr(self, "_fig"):
+            self._fig, (self._ax1, self._ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+        ax1, ax2 = self._ax1, self._ax2
+        ax1.clear()
+        ax2.clear()
+
         # Plot price
         ax1.plot(data["date"], data["price"], 'b-')
         ax1.set_title(f"{token_id.upper()} Price (USD)")
         ax1.set_ylabel("Price (USD)")
         ax1.grid(True)
-        
+
         # Plot volume
         ax2.bar(data["date"], data["volume"], color='g', alpha=0.6)
         ax2.set_title(f"{token_id.upper()} Trading Volume (USD)")
         ax2.set_xlabel("Date")
         ax2.set_ylabel("Volume (USD)")
         ax2.grid(True)
-        
+
         # Format the plot
-        plt.tight_layout()
-        
+        self._fig.tight_layout()
+
         # Save or show the plot
         if save_path:
-            plt.savefig(save_path)
-            plt.close()
+            self._fig.savefig(save_path)
             return save_path
         else:
-            plt.show()
-            plt.close()
+            self._fig.show()
             return None
     
+    def plot_tokens(self, token_ids=None, save_path_format="{token}_analysis.png"):
+        """
+        Plot several tokens' price/volume charts in parallel processes.
+
+        Data is fetched up front (rate-limited as usual), then the CPU-bound
+        matplotlib rasterization fans out over a multiprocessing pool —
+        PNG encoding holds the GIL, so threads would not help here.
+
+        Args:
+            token_ids: Token IDs to plot (default: self.tokens)
+            save_path_format: Format string for output paths, with {token}
+                substituted by the token ID
+
+        Returns:
+            List of saved plot paths
+        """
+        if token_ids is None:
+            token_ids = self.tokens
+
+        # Fetch every series concurrently through the I/O thread pool
+        data_frames = self._executor.map(self.get_token_data, token_ids)
+
+        plot_args = []
+        for token_id, data in zip(token_ids, data_frames):
+            if data is None or len(data) == 0:
+                print(f"No data available for {token_id}")
+                continue
+            plot_args.append((
+                token_id,
+                data["date"].to_numpy(),
+                data["price"].to_numpy(),
+                data["volume"].to_numpy(),
+                save_path_format.format(token=token_id)
+            ))
+
+        if not plot_args:
+            return []
+
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count(), len(plot_args))) as pool:
+            return list(pool.map(_plot_one, *zip(*plot_args)))
+
     def check_sustainability(self, token_id, daily_volume, tax_rate, total_supply_value, daily_roi):
         """
         Check if the token's tax model is sustainable.
@@ -310,13 +841,69 @@ class CryptoMonitor:
         
         return sustainability_report
     
-    def run_health_check(self, output_file=None):
+    def check_sustainability_batch(self, token_ids, daily_volumes, tax_rates,
+                                   total_supply_values, daily_rois):
+        """
+        Check sustainability for many tokens in one vectorized pass.
+
+        Computes the same metrics as check_sustainability, but over numpy
+        arrays covering all tokens at once instead of per-token Python
+        arithmetic, and materializes the report dicts at the end.
+
+        Args:
+            token_ids: Sequence of token identifiers
+            daily_volumes: Estimated daily trading volume per token
+            tax_rates: Tax rate per token
+            total_supply_values: Total value of token supply per token
+            daily_rois: Daily ROI promised/expected per token
+
+        Returns:
+            List of sustainability report dictionaries, one per token
+        """
+        volumes = np.asarray(daily_volumes, dtype=np.float64)
+        rates = np.asarray(tax_rates, dtype=np.float64)
+        supplies = np.asarray(total_supply_values, dtype=np.float64)
+        rois = np.asarray(daily_rois, dtype=np.float64)
+
+        revenues = volumes * rates
+        payouts = supplies * rois
+        sustainable = revenues >= payouts
+        ratios = np.where(payouts > 0, revenues / np.where(payouts > 0, payouts, 1.0), np.inf)
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        reports = []
+        for i, token_id in enumerate(token_ids):
+            report = {
+                "token": token_id,
+                "daily_volume": volumes[i],
+                "tax_rate": rates[i],
+                "daily_tax_revenue": revenues[i],
+                "total_supply_value": supplies[i],
+                "daily_roi": rois[i],
+                "required_payouts": payouts[i],
+                "is_sustainable": bool(sustainable[i]),
+                "sustainability_ratio": ratios[i],
+                "timestamp": timestamp
+            }
+            reports.append(report)
+
+            if not report["is_sustainable"]:
+                print(f"⚠️ Unsustainable ROI for {token_id}!")
+                print(f"  - Daily tax revenue: ${revenues[i]:.2f}")
+                print(f"  - Required for {rois[i]*100}% daily ROI: ${payouts[i]:.2f}")
+                print(f"  - Sustainability ratio: {ratios[i]:.2f}")
+
+        return reports
+
+    def run_health_check(self, output_file=None, ndjson_file=None):
         """
         Run a complete health check on all monitored tokens and wallets.
-        
+
         Args:
             output_file: Path to save the health report (optional)
-            
+            ndjson_file: Path of a rolling NDJSON log to append this
+                check's per-token/per-wallet records to (optional)
+
         Returns:
             Dictionary with complete health report
         """
@@ -328,26 +915,43 @@ class CryptoMonitor:
         
         print(f"Running health check at {health_report['timestamp']}...")
         
-        # Check tokens
-        for token in self.tokens:
-            print(f"Analyzing {token}...")
-            token_health = self.analyze_token_health(token)
+        # Check tokens and wallets concurrently; the calls are independent
+        # I/O-bound requests, so total latency is close to the slowest one
+        # instead of the sum of all of them
+        print(f"Analyzing {len(self.tokens)} tokens...")
+        token_results = self._executor.map(self.analyze_token_health, self.tokens)
+        for token, token_health in zip(self.tokens, token_results):
             if token_health:
                 health_report["tokens"][token] = token_health
-        
-        # Check wallets
-        for name, address in self.wallets.items():
-            print(f"Checking wallet {name}...")
-            wallet_activity = self.check_wallet_activity(wallet_name=name)
-            if wallet_activity:
-                health_report["wallets"][name] = wallet_activity
-        
-        # Save report if requested
+
+        wallet_names = list(self.wallets.keys())
+        if wallet_names:
+            print(f"Checking {len(wallet_names)} wallets...")
+            wallet_results = self._executor.map(
+                lambda name: self.check_wallet_activity(wallet_name=name),
+                wallet_names
+            )
+            for name, wallet_activity in zip(wallet_names, wallet_results):
+                if wallet_activity:
+                    health_report["wallets"][name] = wallet_activity
+        
+        # Collect the requested output files and flush them in one batch
+        payloads = []
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(health_report, f, indent=2)
-            print(f"Health report saved to {output_file}")
-        
+            payloads.append((output_file, dump_json_bytes(health_report), "wb"))
+        if ndjson_file:
+            entries = (
+                [{"type": "token", **report} for report in health_report["tokens"].values()]
+                + [{"type": "wallet", **report} for report in health_report["wallets"].values()]
+            )
+            payloads.append((ndjson_file, _ndjson_payload(entries), "ab"))
+        if payloads:
+            flush_payloads(payloads)
+            if output_file:
+                print(f"Health report saved to {output_file}")
+            if ndjson_file:
+                print(f"Appended {len(entries)} records to {ndjson_file}")
+
         return health_report
 
 
@@ -377,6 +981,5 @@ if __name__ == "__main__":
     #     daily_roi=0.01  # 1%
     # )
     
-    # Generate plots
-    for token in monitor.tokens:
-        monitor.plot_token_data(token, save_path=f"{token}_analysis.png")
+    # Generate plots (rendered in parallel worker processes)
+    monitor.plot_tokens()
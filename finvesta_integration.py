@@ -10,7 +10,12 @@ import requests
 from datetime import datetime
 import json
 import os
-from crypto_monitor import CryptoMonitor
+from crypto_monitor import CryptoMonitor, write_json_report
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 class FinvestaMonitor(CryptoMonitor):
     """Extended monitor with specific support for Finvesta and other tokens."""
@@ -60,6 +65,35 @@ class FinvestaMonitor(CryptoMonitor):
         self.add_wallet(f"{token_id}_{wallet_name}", wallet_address)
         print(f"Added {wallet_name} wallet for {token_id}: {wallet_address}")
     
+    def load_tokens(self, records):
+        """
+        Register a batch of ecosystem tokens in one pass.
+
+        Bulk equivalent of add_token/set_token_tax_rate/
+        set_token_roi_expectation/add_wallet/add_project_wallet: the
+        internal dicts are updated directly instead of dispatching five
+        methods (and five prints) per token. Each token contract address
+        is registered as a single "<token>_contract" wallet.
+
+        Args:
+            records: Iterable of (token_id, TokenInfo) pairs
+        """
+        records = list(records)
+
+        known = set(self.tokens)
+        self.tokens.extend(token_id for token_id, _ in records if token_id not in known)
+
+        self.tax_rates.update((token_id, info.tax_rate) for token_id, info in records)
+        self.roi_expectations.update((token_id, info.daily_roi) for token_id, info in records)
+
+        contracts = [(token_id, info.address) for token_id, info in records if info.address]
+        self.wallets.update((f"{token_id}_contract", address) for token_id, address in contracts)
+        for token_id, address in contracts:
+            self.project_wallets.setdefault(token_id, []).append({
+                "name": f"{token_id}_contract",
+                "address": address
+            })
+
     def set_token_tax_rate(self, token_id, tax_rate):
         """
         Set the tax rate for a specific token.
@@ -95,9 +129,12 @@ class FinvestaMonitor(CryptoMonitor):
         if token_id not in self.project_wallets or not self.project_wallets[token_id]:
             print(f"No project wallets defined for {token_id}")
             return None
-        
+
         tax_distribution = {}
-        
+
+        # Price series for valuing collections in USD (may be unavailable)
+        price_data = self.get_token_data(token_id)
+
         # Analyze transactions for each project wallet
         for wallet_info in self.project_wallets[token_id]:
             wallet_name = wallet_info["name"]
@@ -108,19 +145,65 @@ class FinvestaMonitor(CryptoMonitor):
                 print(f"No transactions found for {token_id} {wallet_name} wallet")
                 continue
             
-            # Analyze incoming transactions (tax collection)
-            incoming_txs = transactions[transactions["to"].str.lower() == wallet_address.lower()]
+            # Analyze incoming transactions (tax collection); addresses are
+            # already lowercased at ingest
+            incoming_txs = transactions[transactions["to"] == wallet_address.lower()]
             
-            # Calculate daily tax collection (last 7 days)
+            # Calculate daily tax collection (last 7 days). Floor timestamps
+            # to days as datetime64 so the groupby stays on int64 keys
+            # (Python date objects would force object-dtype hashing) and
+            # assign() avoids writing into a filtered view of the frame.
             if len(incoming_txs) > 0:
-                incoming_txs["date"] = incoming_txs["datetime"].dt.date
-                daily_tax = incoming_txs.groupby("date")["value_eth"].sum()
-                
+                if pl is not None:
+                    # Polars runs the group-by on its multi-threaded native
+                    # engine; bridge back to a pandas Series only at the end
+                    daily_tax = (
+                        pl.from_pandas(incoming_txs[["datetime", "value_eth"]])
+                        .lazy()
+                        .group_by(pl.col("datetime").dt.date().alias("day"))
+                        .agg(pl.col("value_eth").sum())
+                        .sort("day")
+                        .collect()
+                        .to_pandas()
+                        .set_index("day")["value_eth"]
+                    )
+                else:
+                    daily_tax = (
+                        incoming_txs
+                        .assign(day=incoming_txs["datetime"].values.astype("datetime64[D]"))
+                        .groupby("day", sort=False)["value_eth"]
+                        .sum()
+                        .sort_index()
+                    )
+
                 tax_distribution[wallet_name] = {
                     "total_collected": incoming_txs["value_eth"].sum(),
                     "avg_daily_collection": daily_tax.mean(),
-                    "last_7_days": daily_tax.tail(7).to_dict()
+                    "last_7_days": {
+                        day.strftime("%Y-%m-%d"): value
+                        for day, value in daily_tax.tail(7).items()
+                    }
                 }
+
+                # Value collections in USD by joining each transaction to the
+                # nearest price point. merge_asof does this in one ordered
+                # pass instead of a generic (hash-join) merge on rounded keys.
+                # The wallet timestamps are second-resolution while price
+                # dates are millisecond-resolution; merge_asof requires
+                # matching units, so align the left key first.
+                if price_data is not None and len(price_data) > 0:
+                    priced_txs = pd.merge_asof(
+                        incoming_txs
+                        .assign(datetime=incoming_txs["datetime"].dt.as_unit("ms"))
+                        .sort_values("datetime"),
+                        price_data[["date", "price"]].sort_values("date"),
+                        left_on="datetime",
+                        right_on="date",
+                        direction="nearest",
+                        tolerance=pd.Timedelta("1D")
+                    )
+                    usd_values = priced_txs["value_eth"] * priced_txs["price"]
+                    tax_distribution[wallet_name]["total_collected_usd"] = usd_values.sum()
         
         return {
             "token": token_id,
@@ -129,19 +212,20 @@ class FinvestaMonitor(CryptoMonitor):
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
     
-    def check_token_sustainability(self, token_id, estimate_supply=True):
+    def check_token_sustainability(self, token_id, estimate_supply=True, data=None):
         """
         Check if the token's tax model is sustainable based on actual data.
-        
+
         Args:
             token_id: Token identifier
             estimate_supply: Whether to estimate total supply value from market cap
-            
+            data: Optional pre-fetched frame from get_token_data
+
         Returns:
             Dictionary with sustainability metrics
         """
-        # Get token data
-        token_data = self.get_token_data(token_id)
+        # Get token data unless the caller already fetched it
+        token_data = data if data is not None else self.get_token_data(token_id)
         if token_data is None or len(token_data) == 0:
             print(f"No data available for {token_id}")
             return None
@@ -178,6 +262,40 @@ class FinvestaMonitor(CryptoMonitor):
             daily_roi=daily_roi
         )
     
+    def analyze_tokens_batch(self, token_ids, include_history=False):
+        """
+        Analyze many tokens' current health from one batched price call.
+
+        A single /simple/price request covers price, 24h volume and 24h
+        change for every token, so the whole pass costs one round-trip.
+        When include_history is True the 30-day series are fetched as well
+        (concurrently, through the usual rate limiter) for full reports.
+
+        Args:
+            token_ids: List of token IDs to analyze
+            include_history: Whether to fetch 30-day series per token
+
+        Returns:
+            Dictionary mapping token ID to its health report
+        """
+        if include_history:
+            reports = self._executor.map(self.analyze_token_health, token_ids)
+            return {
+                token_id: report
+                for token_id, report in zip(token_ids, reports)
+                if report
+            }
+
+        snapshot = self.get_tokens_snapshot(token_ids)
+        results = {}
+        for token_id in token_ids:
+            report = self.analyze_token_health(
+                token_id, snapshot=snapshot, include_history=False
+            )
+            if report:
+                results[token_id] = report
+        return results
+
     def analyze_multi_token_ecosystem(self, token_ids=None):
         """
         Analyze the health of multiple tokens in an ecosystem.
@@ -203,23 +321,42 @@ class FinvestaMonitor(CryptoMonitor):
         
         total_volume = 0
         price_changes = []
-        sustainability_scores = []
-        
+        sustainability_inputs = []
+
         # Analyze each token
         for token_id in token_ids:
             print(f"Analyzing {token_id}...")
-            
+
+            # Fetch the series once and share it between the health and
+            # sustainability checks instead of hitting CoinGecko twice
+            token_data = self.get_token_data(token_id)
+
             # Get token health
-            token_health = self.analyze_token_health(token_id)
+            token_health = self.analyze_token_health(token_id, data=token_data)
             if token_health:
                 ecosystem_health["tokens"][token_id] = token_health
                 total_volume += token_health["current_volume"]
                 price_changes.append(token_health["price_change_30d"])
-            
-            # Check sustainability
-            sustainability = self.check_token_sustainability(token_id)
-            if sustainability and sustainability["sustainability_ratio"] > 0:
-                sustainability_scores.append(sustainability["sustainability_ratio"])
+
+            # Collect sustainability inputs for one vectorized batch check
+            # after the loop (same estimation as check_token_sustainability)
+            if token_data is not None and len(token_data) > 0:
+                avg_daily_volume = token_data["volume"].mean()
+                sustainability_inputs.append((
+                    token_id,
+                    avg_daily_volume,
+                    self.tax_rates.get(token_id, 0.05),
+                    avg_daily_volume * 10,
+                    self.roi_expectations.get(token_id, 0.01)
+                ))
+
+        # Check sustainability for all tokens in one numpy pass
+        sustainability_scores = []
+        if sustainability_inputs:
+            ids, volumes, rates, supplies, rois = zip(*sustainability_inputs)
+            for sustainability in self.check_sustainability_batch(ids, volumes, rates, supplies, rois):
+                if sustainability["sustainability_ratio"] > 0:
+                    sustainability_scores.append(sustainability["sustainability_ratio"])
         
         # Calculate ecosystem metrics
         ecosystem_health["ecosystem_metrics"]["total_volume"] = total_volume
@@ -266,8 +403,7 @@ class FinvestaMonitor(CryptoMonitor):
         
         # Save report if requested
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(health_report, f, indent=2)
+            write_json_report(health_report, output_file)
             print(f"Finvesta health report saved to {output_file}")
         
         return health_report
@@ -299,6 +435,5 @@ if __name__ == "__main__":
     # Run Finvesta-specific health check
     health_report = monitor.run_finvesta_health_check(output_file="finvesta_health_report.json")
     
-    # Generate plots for all tokens
-    for token in monitor.tokens:
-        monitor.plot_token_data(token, save_path=f"{token}_analysis.png")
+    # Generate plots for all tokens (rendered in parallel worker processes)
+    monitor.plot_tokens()
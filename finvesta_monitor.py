@@ -6,23 +6,38 @@ This script integrates the Finvesta ecosystem token information with the
 crypto tax economy health monitoring program.
 """
 
-import os
 import sys
-import json
+import time
 from datetime import datetime
+from pathlib import Path
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Import the monitoring classes
-from crypto_monitor import CryptoMonitor
-from finvesta_integration import FinvestaMonitor
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# The monitoring classes (and their pandas/matplotlib/requests baggage)
+# are imported lazily inside the branches that need them, so cheap
+# commands like --list and --relationships start instantly
 
 # Import token configurations
-from finvesta_tokens import FINVESTA_TOKENS
+from finvesta_tokens import FINVESTA_TOKENS, TOKEN_IDS, TOKEN_ITEMS, PLOT_PATHS
+
+# Tracks whether the output directories were already created, so repeat
+# calls within one process skip the mkdir syscalls
+_DIRS_READY = False
+
 
 def setup_directories():
     """Create necessary directories for reports and plots."""
-    os.makedirs("reports", exist_ok=True)
-    os.makedirs("plots", exist_ok=True)
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for directory in ("reports", "plots"):
+        Path(directory).mkdir(exist_ok=True)
+    _DIRS_READY = True
 
 def configure_finvesta_monitor():
     """
@@ -31,63 +46,93 @@ def configure_finvesta_monitor():
     Returns:
         Configured FinvestaMonitor instance
     """
-    # Create the monitor instance
+    from finvesta_integration import FinvestaMonitor
+
+    # Create the monitor instance and register the whole ecosystem in one
+    # bulk pass
     monitor = FinvestaMonitor()
-    
-    # Add tokens from the Finvesta ecosystem
-    for token_id, token_info in FINVESTA_TOKENS.items():
-        monitor.add_token(token_id, token_info["name"])
-        
-        # Set tax rate and ROI expectation
-        if "tax_rate" in token_info:
-            monitor.set_token_tax_rate(token_id, token_info["tax_rate"])
-        
-        if "daily_roi" in token_info:
-            monitor.set_token_roi_expectation(token_id, token_info["daily_roi"])
-        
-        # Add token address as a wallet to monitor
-        if token_info["address"]:
-            monitor.add_wallet(f"{token_id}_contract", token_info["address"])
-            monitor.add_project_wallet(token_id, f"{token_id}_contract", token_info["address"])
-    
+    monitor.load_tokens(TOKEN_ITEMS)
+
     return monitor
 
+# On-disk result cache so repeated CLI invocations within the same
+# five-minute bucket skip the fetch/compute/plot path entirely
+_analysis_cache = None
+
+
+def _get_analysis_cache():
+    """Return the shared diskcache instance, or None when unavailable."""
+    global _analysis_cache
+    if _analysis_cache is None and diskcache is not None:
+        _analysis_cache = diskcache.Cache("reports/.cache")
+    return _analysis_cache
+
+
 def analyze_token(monitor, token_id, check_sustainability=True, generate_plot=True):
     """
     Analyze a specific token in the Finvesta ecosystem.
-    
+
+    Results are cached on disk per (token, options, 5-minute bucket), so
+    e.g. an --ecosystem run followed by --token X within a few minutes
+    serves X from cache instead of re-fetching and re-plotting.
+
     Args:
         monitor: FinvestaMonitor instance
         token_id: Token ID to analyze
         check_sustainability: Whether to check sustainability
         generate_plot: Whether to generate a plot
-        
+
     Returns:
         Dictionary with analysis results
     """
+    cache = _get_analysis_cache()
+    if cache is None:
+        return _analyze_token_uncached(monitor, token_id, check_sustainability, generate_plot)
+
+    key = (token_id, int(time.time() // 300), check_sustainability, generate_plot)
+    if key in cache:
+        return cache[key]
+
+    result = _analyze_token_uncached(monitor, token_id, check_sustainability, generate_plot)
+    if result is not None:
+        cache.set(key, result, expire=600)
+    return result
+
+
+def _analyze_token_uncached(monitor, token_id, check_sustainability, generate_plot):
+    """
+    Uncached analysis path behind analyze_token.
+
+    token_id is assumed valid: argparse restricts --token to the ecosystem
+    tokens, and the batch paths iterate TOKEN_IDS directly.
+    """
     print(f"Analyzing {token_id}...")
-    
-    # Get token info
-    token_info = FINVESTA_TOKENS.get(token_id)
-    if not token_info:
-        print(f"Token {token_id} not found in Finvesta ecosystem")
-        return None
-    
+
+    # Fetch the price/volume series once and reuse it for health,
+    # sustainability, and the plot
+    data = monitor.get_token_data(token_id)
+
     # Analyze token health
-    health = monitor.analyze_token_health(token_id)
-    
+    health = monitor.analyze_token_health(token_id, data=data)
+
     # Check sustainability if requested
     if check_sustainability:
-        sustainability = monitor.check_token_sustainability(token_id)
+        sustainability = monitor.check_token_sustainability(token_id, data=data)
         if health and sustainability:
             health["sustainability"] = sustainability
-    
-    # Generate plot if requested
-    if generate_plot and health:
-        plot_path = f"plots/{token_id}_analysis.png"
-        monitor.plot_token_data(token_id, save_path=plot_path)
-        health["plot"] = plot_path
-    
+
+    # Generate plot if requested; a single token renders inline from the
+    # already-fetched frame rather than refetching through plot_tokens
+    if generate_plot and health and data is not None and len(data) > 0:
+        from crypto_monitor import _plot_one
+        health["plot"] = _plot_one(
+            token_id,
+            data["date"].to_numpy(),
+            data["price"].to_numpy(),
+            data["volume"].to_numpy(),
+            PLOT_PATHS[token_id]
+        )
+
     return health
 
 def analyze_ecosystem(monitor, output_file=None):
@@ -104,23 +149,31 @@ def analyze_ecosystem(monitor, output_file=None):
     print("Analyzing Finvesta ecosystem...")
     
     # Run ecosystem analysis
-    ecosystem = monitor.analyze_multi_token_ecosystem(list(FINVESTA_TOKENS.keys()))
-    
-    # Generate plots for all tokens
+    ecosystem = monitor.analyze_multi_token_ecosystem(TOKEN_IDS)
+
+    # Generate plots for all tokens in parallel worker processes; the
+    # serial per-token loop left the rasterization cost as pure added
+    # wall time on top of the analysis
     if ecosystem:
-        for token_id in FINVESTA_TOKENS.keys():
-            plot_path = f"plots/{token_id}_analysis.png"
-            try:
-                monitor.plot_token_data(token_id, save_path=plot_path)
-                if token_id in ecosystem["tokens"]:
-                    ecosystem["tokens"][token_id]["plot"] = plot_path
-            except Exception as e:
-                print(f"Error generating plot for {token_id}: {str(e)}")
+        try:
+            plot_paths = monitor.plot_tokens(
+                TOKEN_IDS,
+                save_path_format="plots/{token}_analysis.png"
+            )
+        except Exception as e:
+            print(f"Error generating plots: {str(e)}")
+            plot_paths = []
+
+        saved_paths = set(plot_paths)
+        for token_id in TOKEN_IDS:
+            plot_path = PLOT_PATHS[token_id]
+            if plot_path in saved_paths and token_id in ecosystem["tokens"]:
+                ecosystem["tokens"][token_id]["plot"] = plot_path
     
     # Save report if requested
     if output_file and ecosystem:
-        with open(output_file, 'w') as f:
-            json.dump(ecosystem, f, indent=2)
+        from crypto_monitor import write_json_report
+        write_json_report(ecosystem, output_file)
         print(f"Ecosystem report saved to {output_file}")
     
     return ecosystem
@@ -132,135 +185,198 @@ def check_token_relationships():
     Returns:
         Dictionary with token relationship analysis
     """
-    relationships = {}
-    
-    # Find tokens that reward other tokens
-    for token_id, token_info in FINVESTA_TOKENS.items():
-        if "rewards" in token_info and token_info["rewards"]:
-            for reward in token_info["rewards"]:
-                if reward not in relationships:
-                    relationships[reward] = {"rewarded_by": []}
-                
-                relationships[reward]["rewarded_by"].append({
-                    "token": token_id,
-                    "name": token_info["name"]
-                })
-    
-    # Find tokens that are rewarded by other tokens
-    for token_id in FINVESTA_TOKENS.keys():
-        if token_id not in relationships:
-            relationships[token_id] = {"rewarded_by": []}
-    
+    # Seed every ecosystem token up front, then fill in the reward edges in
+    # one pass; setdefault covers rewards pointing outside the ecosystem
+    relationships = {token_id: {"rewarded_by": []} for token_id in TOKEN_IDS}
+
+    for token_id, token_info in TOKEN_ITEMS:
+        for reward in token_info.rewards:
+            relationships.setdefault(reward, {"rewarded_by": []})["rewarded_by"].append({
+                "token": token_id,
+                "name": token_info.name
+            })
+
     return relationships
 
 def main():
     """Main function to run the Finvesta ecosystem monitoring program."""
     parser = argparse.ArgumentParser(description="Finvesta Ecosystem Monitoring Program")
-    parser.add_argument("--token", help="Analyze a specific token in the Finvesta ecosystem")
+    parser.add_argument("--token", choices=tuple(FINVESTA_TOKENS), metavar="TOKEN_ID",
+                        help="Analyze a specific token in the Finvesta ecosystem")
     parser.add_argument("--list", action="store_true", help="List all tokens in the Finvesta ecosystem")
     parser.add_argument("--ecosystem", action="store_true", help="Analyze the entire Finvesta ecosystem")
     parser.add_argument("--relationships", action="store_true", help="Analyze token relationships")
     parser.add_argument("--sustainability", action="store_true", help="Check sustainability of tax models")
+    parser.add_argument("--quick", action="store_true", help="Current metrics only, from one batched price call")
     parser.add_argument("--plot", action="store_true", help="Generate plots")
+    parser.add_argument("--verbose", action="store_true", help="Dump report JSON to stdout")
     parser.add_argument("--output", help="Save the report to a file")
     
     args = parser.parse_args()
-    
-    # Create necessary directories
+
+    # Dispatch on the first truthy flag; each action builds only what it
+    # needs (the listing branches never touch the monitor stack)
+    for attr, action in DISPATCH:
+        if getattr(args, attr):
+            action(args)
+            return
+    do_health_check(args)
+
+
+def do_list(args):
+    """List the ecosystem tokens; build the whole listing first and write
+    it in one go instead of several line-buffered prints per token."""
+    buf = ["Tokens in the Finvesta ecosystem:\n"]
+    for token_id, token_info in TOKEN_ITEMS:
+        buf.append(f"- {token_info.name} ({token_id})\n")
+        buf.append(f"  Address: {token_info.address}\n")
+        if token_info.rewards:
+            buf.append(f"  Rewards: {', '.join(token_info.rewards)}\n")
+        if token_info.notes:
+            buf.append(f"  Notes: {token_info.notes}\n")
+        buf.append("\n")
+    sys.stdout.write("".join(buf))
+
+
+def do_token(args):
+    """Analyze the single token named by --token."""
     setup_directories()
-    
-    # List tokens if requested
-    if args.list:
-        print("Tokens in the Finvesta ecosystem:")
-        for token_id, token_info in FINVESTA_TOKENS.items():
-            print(f"- {token_info['name']} ({token_id})")
-            print(f"  Address: {token_info['address']}")
-            if "rewards" in token_info and token_info["rewards"]:
-                print(f"  Rewards: {', '.join(token_info['rewards'])}")
-            if "notes" in token_info and token_info["notes"]:
-                print(f"  Notes: {token_info['notes']}")
-            print()
-        return
-    
-    # Configure the monitor
     monitor = configure_finvesta_monitor()
-    
-    # Process command-line arguments
-    if args.token:
-        # Analyze a specific token
-        token_analysis = analyze_token(
-            monitor, 
-            args.token, 
-            check_sustainability=args.sustainability,
-            generate_plot=args.plot
-        )
-        
-        if token_analysis:
-            print(json.dumps(token_analysis, indent=2))
-            
-            if args.output:
-                with open(args.output, 'w') as f:
-                    json.dump(token_analysis, f, indent=2)
-                print(f"Token analysis saved to {args.output}")
-    
-    elif args.relationships:
-        # Analyze token relationships
-        relationships = check_token_relationships()
-        print("Token relationships in the Finvesta ecosystem:")
-        
-        for token_id, relation in relationships.items():
-            if token_id in FINVESTA_TOKENS:
-                token_name = FINVESTA_TOKENS[token_id]["name"]
-            else:
-                token_name = token_id.upper()
-                
-            print(f"- {token_name} ({token_id}):")
-            
-            if relation["rewarded_by"]:
-                print(f"  Rewarded by:")
-                for rewarding_token in relation["rewarded_by"]:
-                    print(f"    - {rewarding_token['name']} ({rewarding_token['token']})")
-            else:
-                print(f"  Not rewarded by any token in the ecosystem")
-            
-            print()
-        
+    token_analysis = analyze_token(
+        monitor,
+        args.token,
+        check_sustainability=args.sustainability,
+        generate_plot=args.plot
+    )
+
+    if token_analysis:
+        from crypto_monitor import dump_json_bytes, write_json_report
+
+        # Serialize once; the same bytes back both stdout and the file
+        payload = dump_json_bytes(token_analysis)
+        if args.verbose or not args.output:
+            sys.stdout.buffer.write(payload)
+            sys.stdout.buffer.write(b"\n")
+
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(relationships, f, indent=2)
-            print(f"Relationship analysis saved to {args.output}")
-    
-    elif args.ecosystem:
-        # Analyze the entire ecosystem
-        ecosystem_analysis = analyze_ecosystem(monitor, args.output)
-        
-        if ecosystem_analysis:
-            print("\nEcosystem health summary:")
-            print(f"Total volume: ${ecosystem_analysis['ecosystem_metrics']['total_volume']:.2f}")
-            print(f"Average price change: {ecosystem_analysis['ecosystem_metrics']['avg_price_change']:.2f}%")
-            print(f"Sustainability score: {ecosystem_analysis['ecosystem_metrics']['sustainability_score']:.2f}")
-            print(f"Health status: {ecosystem_analysis['ecosystem_metrics']['health_status']}")
-    
-    else:
-        # Default behavior: run a basic health check on all tokens
-        print("Running basic health check on all tokens in the Finvesta ecosystem...")
-        
-        results = {}
-        for token_id in FINVESTA_TOKENS.keys():
-            token_health = analyze_token(
-                monitor, 
-                token_id, 
-                check_sustainability=args.sustainability,
-                generate_plot=args.plot
-            )
-            
-            if token_health:
-                results[token_id] = token_health
-        
+            write_json_report(token_analysis, args.output, payload=payload)
+            print(f"Token analysis saved to {args.output}")
+
+
+def do_relationships(args):
+    """Report which ecosystem tokens reward which."""
+    relationships = check_token_relationships()
+
+    # Buffer the whole printout and write it once
+    buf = ["Token relationships in the Finvesta ecosystem:\n"]
+    for token_id, relation in relationships.items():
+        if token_id in FINVESTA_TOKENS:
+            token_name = FINVESTA_TOKENS[token_id].name
+        else:
+            token_name = token_id.upper()
+
+        buf.append(f"- {token_name} ({token_id}):\n")
+
+        if relation["rewarded_by"]:
+            buf.append("  Rewarded by:\n")
+            for rewarding_token in relation["rewarded_by"]:
+                buf.append(f"    - {rewarding_token['name']} ({rewarding_token['token']})\n")
+        else:
+            buf.append("  Not rewarded by any token in the ecosystem\n")
+
+        buf.append("\n")
+    sys.stdout.write("".join(buf))
+
+    if args.output:
+        from crypto_monitor import write_json_report
+        setup_directories()
+        write_json_report(relationships, args.output)
+        print(f"Relationship analysis saved to {args.output}")
+
+
+def do_ecosystem(args):
+    """Analyze the entire ecosystem and print the health summary."""
+    setup_directories()
+    monitor = configure_finvesta_monitor()
+    ecosystem_analysis = analyze_ecosystem(monitor, args.output)
+
+    if ecosystem_analysis:
+        print("\nEcosystem health summary:")
+        print(f"Total volume: ${ecosystem_analysis['ecosystem_metrics']['total_volume']:.2f}")
+        print(f"Average price change: {ecosystem_analysis['ecosystem_metrics']['avg_price_change']:.2f}%")
+        print(f"Sustainability score: {ecosystem_analysis['ecosystem_metrics']['sustainability_score']:.2f}")
+        print(f"Health status: {ecosystem_analysis['ecosystem_metrics']['health_status']}")
+
+
+def do_health_check(args):
+    """Default action: run a basic health check on all ecosystem tokens."""
+    print("Running basic health check on all tokens in the Finvesta ecosystem...")
+    setup_directories()
+    monitor = configure_finvesta_monitor()
+
+    # Quick mode: current metrics for every token from a single
+    # batched /simple/price round-trip, no per-token history calls
+    if args.quick:
+        from crypto_monitor import dump_json_bytes, write_json_report
+        results = monitor.analyze_tokens_batch(TOKEN_IDS)
+        payload = dump_json_bytes(results)
+        if args.verbose or not args.output:
+            sys.stdout.buffer.write(payload)
+            sys.stdout.buffer.write(b"\n")
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2)
+            write_json_report(results, args.output, payload=payload)
             print(f"Health check results saved to {args.output}")
+        return
+
+    # Each token's analysis is an independent I/O-bound fetch, so run
+    # them all concurrently. Plots are generated afterwards through the
+    # process pool (the cached-figure plotting path isn't thread-safe).
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(16, len(FINVESTA_TOKENS))) as executor:
+        futures = {
+            executor.submit(
+                analyze_token,
+                monitor,
+                token_id,
+                check_sustainability=args.sustainability,
+                generate_plot=False
+            ): token_id
+            for token_id in TOKEN_IDS
+        }
+        completed = {}
+        for future in as_completed(futures):
+            token_health = future.result()
+            if token_health:
+                completed[futures[future]] = token_health
+
+    # Keep the report in ecosystem order regardless of completion order
+    for token_id in TOKEN_IDS:
+        if token_id in completed:
+            results[token_id] = completed[token_id]
+
+    if args.plot and results:
+        saved_paths = set(monitor.plot_tokens(
+            list(results.keys()),
+            save_path_format="plots/{token}_analysis.png"
+        ))
+        for token_id, token_health in results.items():
+            if PLOT_PATHS[token_id] in saved_paths:
+                token_health["plot"] = PLOT_PATHS[token_id]
+
+    if args.output:
+        from crypto_monitor import write_json_report
+        write_json_report(results, args.output)
+        print(f"Health check results saved to {args.output}")
+
+
+# Flag-to-action table, in the old elif order; main takes the first
+# truthy flag and falls through to do_health_check
+DISPATCH = (
+    ("list", do_list),
+    ("token", do_token),
+    ("relationships", do_relationships),
+    ("ecosystem", do_ecosystem),
+)
 
 
 if __name__ == "__main__":
@@ -21,26 +21,37 @@ Options:
 """
 
 import argparse
-import os
-import json
+import importlib.util
 import sys
 from datetime import datetime
+from pathlib import Path
 
-# Import the monitoring classes
-from crypto_monitor import CryptoMonitor
-from finvesta_integration import FinvestaMonitor
+# The monitoring classes (and their pandas/matplotlib/requests baggage)
+# are imported lazily where they are used, keeping --help and argument
+# errors fast
 
 # Import configuration
 from config import TOKENS, WALLETS, MONITORING_CONFIG, OUTPUT_CONFIG
 
 
+# Tracks whether the output directories were already created, so repeat
+# calls within one process skip the mkdir syscalls
+_DIRS_READY = False
+
+
 def setup_directories():
     """Create necessary directories for reports and plots."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+
     if OUTPUT_CONFIG["save_reports"]:
-        os.makedirs(OUTPUT_CONFIG["report_directory"], exist_ok=True)
-    
+        Path(OUTPUT_CONFIG["report_directory"]).mkdir(parents=True, exist_ok=True)
+
     if OUTPUT_CONFIG["generate_plots"]:
-        os.makedirs(OUTPUT_CONFIG["plot_directory"], exist_ok=True)
+        Path(OUTPUT_CONFIG["plot_directory"]).mkdir(parents=True, exist_ok=True)
+
+    _DIRS_READY = True
 
 
 def configure_monitor(use_finvesta=False):
@@ -54,7 +65,12 @@ def configure_monitor(use_finvesta=False):
         Configured monitor instance
     """
     # Create the appropriate monitor instance
-    monitor = FinvestaMonitor() if use_finvesta else CryptoMonitor()
+    if use_finvesta:
+        from finvesta_integration import FinvestaMonitor
+        monitor = FinvestaMonitor()
+    else:
+        from crypto_monitor import CryptoMonitor
+        monitor = CryptoMonitor()
     
     # Add tokens from configuration
     for token_id, token_info in TOKENS.items():
@@ -80,27 +96,72 @@ def configure_monitor(use_finvesta=False):
     return monitor
 
 
-def save_report(report, filename=None):
+def save_report(report, filename=None, payload=None):
     """
     Save a report to a file.
-    
+
     Args:
         report: Report data to save
         filename: Filename to save to (optional)
+        payload: Pre-serialized bytes for the same report (optional)
     """
     if not OUTPUT_CONFIG["save_reports"]:
         return
-    
+
     if filename is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{OUTPUT_CONFIG['report_directory']}/health_report_{timestamp}.json"
-    
-    with open(filename, 'w') as f:
-        json.dump(report, f, indent=2)
-    
+
+    from crypto_monitor import write_json_report
+    write_json_report(report, filename, payload=payload)
     print(f"Report saved to {filename}")
 
 
+def emit_report(report, args, filename=None):
+    """
+    Print and/or save a report, serializing it exactly once.
+
+    The JSON dump goes to stdout when --verbose is set or when no output
+    file was requested; the same bytes back the file write.
+
+    Args:
+        report: Report data to emit
+        args: Parsed command-line arguments
+        filename: Filename to save to when --output is set (optional)
+    """
+    from crypto_monitor import dump_json_bytes
+
+    payload = dump_json_bytes(report)
+    if args.verbose or not args.output:
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.write(b"\n")
+    if args.output:
+        save_report(report, filename or args.output, payload=payload)
+
+
+def load_custom_config(config_path):
+    """
+    Load a custom configuration module and apply its settings.
+
+    Imports the file as a real module (so CPython caches the compiled
+    bytecode under __pycache__ for warm runs) instead of exec'ing its
+    source, and overrides only the settings the file defines.
+
+    Args:
+        config_path: Path to the configuration file
+    """
+    global TOKENS, WALLETS, MONITORING_CONFIG, OUTPUT_CONFIG
+
+    spec = importlib.util.spec_from_file_location("user_config", config_path)
+    config_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config_module)
+
+    TOKENS = getattr(config_module, "TOKENS", TOKENS)
+    WALLETS = getattr(config_module, "WALLETS", WALLETS)
+    MONITORING_CONFIG = getattr(config_module, "MONITORING_CONFIG", MONITORING_CONFIG)
+    OUTPUT_CONFIG = getattr(config_module, "OUTPUT_CONFIG", OUTPUT_CONFIG)
+
+
 def main():
     """Main function to parse arguments and run the program."""
     parser = argparse.ArgumentParser(description="Crypto Tax Economy Health Monitoring Program")
@@ -111,111 +172,128 @@ def main():
     parser.add_argument("--check-all", action="store_true", help="Run a complete health check on all tokens and wallets")
     parser.add_argument("--finvesta", action="store_true", help="Run Finvesta-specific health check")
     parser.add_argument("--sustainability", action="store_true", help="Check sustainability of tax models")
+    parser.add_argument("--verbose", action="store_true", help="Dump report JSON to stdout even when saving to a file")
     parser.add_argument("--config", help="Use a custom configuration file")
     
     args = parser.parse_args()
-    
-    # Create necessary directories
-    setup_directories()
-    
+
     # Use custom configuration file if specified
     if args.config:
         try:
-            exec(open(args.config).read())
+            load_custom_config(args.config)
             print(f"Using custom configuration from {args.config}")
         except Exception as e:
             print(f"Error loading custom configuration: {str(e)}")
             sys.exit(1)
+
+    # Create necessary directories, after any custom OUTPUT_CONFIG has
+    # replaced the defaults
+    setup_directories()
     
     # Determine whether to use FinvestaMonitor
     use_finvesta = args.finvesta or "finvesta" in TOKENS
-    
+
     # Configure the monitor
     monitor = configure_monitor(use_finvesta)
-    
-    # Process command-line arguments
-    if args.token:
-        print(f"Analyzing token: {args.token}")
-        token_health = monitor.analyze_token_health(args.token)
-        print(json.dumps(token_health, indent=2))
-        
-        if args.sustainability:
-            print(f"Checking sustainability for {args.token}")
-            if use_finvesta:
-                sustainability = monitor.check_token_sustainability(args.token)
-            else:
-                # Use default values for demonstration
-                sustainability = monitor.check_sustainability(
-                    token_id=args.token,
-                    daily_volume=1000000,  # $1M
-                    tax_rate=TOKENS.get(args.token, {}).get("tax_rate", 0.05),
-                    total_supply_value=10000000,  # $10M
-                    daily_roi=TOKENS.get(args.token, {}).get("daily_roi", 0.01)
-                )
-            print(json.dumps(sustainability, indent=2))
-        
-        if args.plot:
-            plot_path = f"{OUTPUT_CONFIG['plot_directory']}/{args.token}_analysis.png"
-            monitor.plot_token_data(args.token, save_path=plot_path)
-            print(f"Plot saved to {plot_path}")
-        
-        if args.output:
-            save_report(token_health, args.output)
-    
-    elif args.wallet:
-        print(f"Checking wallet: {args.wallet}")
-        if args.wallet in WALLETS:
-            wallet_address = WALLETS[args.wallet]["address"]
-            wallet_activity = monitor.check_wallet_activity(wallet_name=args.wallet)
+
+    # Dispatch on the first truthy flag, falling through to the basic
+    # health check
+    for attr, action in DISPATCH:
+        if getattr(args, attr):
+            action(args, monitor)
+            return
+    do_basic_check(args, monitor)
+
+
+def do_token(args, monitor):
+    """Analyze the single token named by --token."""
+    print(f"Analyzing token: {args.token}")
+    token_health = monitor.analyze_token_health(args.token)
+    emit_report(token_health, args)
+
+    if args.sustainability:
+        print(f"Checking sustainability for {args.token}")
+        if args.finvesta or "finvesta" in TOKENS:
+            sustainability = monitor.check_token_sustainability(args.token)
         else:
-            wallet_activity = monitor.check_wallet_activity(wallet_address=args.wallet)
-        
-        print(json.dumps(wallet_activity, indent=2))
-        
-        if args.output:
-            save_report(wallet_activity, args.output)
-    
-    elif args.finvesta:
-        print("Running Finvesta-specific health check...")
-        if not use_finvesta:
-            print("Error: Finvesta-specific health check requires FinvestaMonitor.")
-            print("Please add Finvesta to the TOKENS configuration.")
-            sys.exit(1)
-        
-        health_report = monitor.run_finvesta_health_check()
-        print(json.dumps(health_report, indent=2))
-        
-        if args.plot:
-            for token in monitor.tokens:
-                plot_path = f"{OUTPUT_CONFIG['plot_directory']}/{token}_analysis.png"
-                monitor.plot_token_data(token, save_path=plot_path)
-                print(f"Plot saved to {plot_path}")
-        
-        if args.output:
-            save_report(health_report, args.output)
-    
-    elif args.check_all:
-        print("Running complete health check on all tokens and wallets...")
-        health_report = monitor.run_health_check()
-        print(json.dumps(health_report, indent=2))
-        
-        if args.plot:
-            for token in monitor.tokens:
-                plot_path = f"{OUTPUT_CONFIG['plot_directory']}/{token}_analysis.png"
-                monitor.plot_token_data(token, save_path=plot_path)
-                print(f"Plot saved to {plot_path}")
-        
-        if args.output:
-            save_report(health_report, args.output)
-    
+            # Use default values for demonstration
+            sustainability = monitor.check_sustainability(
+                token_id=args.token,
+                daily_volume=1000000,  # $1M
+                tax_rate=TOKENS.get(args.token, {}).get("tax_rate", 0.05),
+                total_supply_value=10000000,  # $10M
+                daily_roi=TOKENS.get(args.token, {}).get("daily_roi", 0.01)
+            )
+        if args.verbose or not args.output:
+            from crypto_monitor import dump_json_bytes
+            sys.stdout.buffer.write(dump_json_bytes(sustainability))
+            sys.stdout.buffer.write(b"\n")
+
+    if args.plot:
+        plot_path = f"{OUTPUT_CONFIG['plot_directory']}/{args.token}_analysis.png"
+        monitor.plot_token_data(args.token, save_path=plot_path)
+        print(f"Plot saved to {plot_path}")
+
+
+def do_wallet(args, monitor):
+    """Check the wallet named by --wallet."""
+    print(f"Checking wallet: {args.wallet}")
+    if args.wallet in WALLETS:
+        wallet_activity = monitor.check_wallet_activity(wallet_name=args.wallet)
     else:
-        # Default behavior: run a basic health check
-        print("Running basic health check...")
-        health_report = monitor.run_health_check()
-        print(json.dumps(health_report, indent=2))
-        
-        if args.output:
-            save_report(health_report, args.output)
+        wallet_activity = monitor.check_wallet_activity(wallet_address=args.wallet)
+
+    emit_report(wallet_activity, args)
+
+
+def _plot_all_tokens(monitor):
+    """Save a plot per monitored token into the configured plot directory."""
+    for token in monitor.tokens:
+        plot_path = f"{OUTPUT_CONFIG['plot_directory']}/{token}_analysis.png"
+        monitor.plot_token_data(token, save_path=plot_path)
+        print(f"Plot saved to {plot_path}")
+
+
+def do_finvesta(args, monitor):
+    """Run the Finvesta-specific health check."""
+    print("Running Finvesta-specific health check...")
+    if not hasattr(monitor, "run_finvesta_health_check"):
+        print("Error: Finvesta-specific health check requires FinvestaMonitor.")
+        print("Please add Finvesta to the TOKENS configuration.")
+        sys.exit(1)
+
+    health_report = monitor.run_finvesta_health_check()
+    emit_report(health_report, args)
+
+    if args.plot:
+        _plot_all_tokens(monitor)
+
+
+def do_check_all(args, monitor):
+    """Run a complete health check on all tokens and wallets."""
+    print("Running complete health check on all tokens and wallets...")
+    health_report = monitor.run_health_check()
+    emit_report(health_report, args)
+
+    if args.plot:
+        _plot_all_tokens(monitor)
+
+
+def do_basic_check(args, monitor):
+    """Default action: run a basic health check."""
+    print("Running basic health check...")
+    health_report = monitor.run_health_check()
+    emit_report(health_report, args)
+
+
+# Flag-to-action table, in the old elif order; main takes the first
+# truthy flag and falls through to do_basic_check
+DISPATCH = (
+    ("token", do_token),
+    ("wallet", do_wallet),
+    ("finvesta", do_finvesta),
+    ("check_all", do_check_all),
+)
 
 
 if __name__ == "__main__":